@@ -1,54 +1,100 @@
 """Lookout Gallery integration for Home Assistant."""
 from __future__ import annotations
 
-import asyncio
 import base64
-import json
+import hashlib
 import logging
 import os
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
+from aiohttp import web
+
+try:
+    import aiofiles
+except ImportError:
+    aiofiles = None
+
+try:
+    import pybase64
+except ImportError:
+    pybase64 = None
+
 from homeassistant.components import websocket_api
 from homeassistant.components.frontend import add_extra_js_url
-from homeassistant.components.http import StaticPathConfig
+from homeassistant.components.http import HomeAssistantView, StaticPathConfig
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.helpers.start import async_at_started
 from homeassistant.helpers.typing import ConfigType
 import voluptuous as vol
 
 from .const import (
     CONF_AUTO_GENERATE,
+    CONF_CACHE_SIZE,
     CONF_FRAME_POSITION,
+    CONF_MAX_CONCURRENCY,
     CONF_MEDIA_PATHS,
     CONF_THUMBNAIL_FOLDER,
     CONF_THUMBNAIL_HEIGHT,
     CONF_THUMBNAIL_QUALITY,
     CONF_THUMBNAIL_WIDTH,
     DEFAULT_AUTO_GENERATE,
+    DEFAULT_CACHE_SIZE,
     DEFAULT_FRAME_POSITION,
+    DEFAULT_MAX_CONCURRENCY,
     DEFAULT_THUMBNAIL_FOLDER,
     DEFAULT_THUMBNAIL_HEIGHT,
     DEFAULT_THUMBNAIL_QUALITY,
     DEFAULT_THUMBNAIL_WIDTH,
     DOMAIN,
+    VERSION,
 )
+from .cache import DB_FILENAME, ThumbnailCacheStore
 from .thumbnail import ThumbnailGenerator
 
 _LOGGER = logging.getLogger(__name__)
 
 FRONTEND_SCRIPT_URL = "/lookout_gallery/lookout-gallery-card.js"
+THUMBNAIL_URL_BASE = "/api/lookout_gallery/thumb"
 
+# LRU bound for the thumb_id -> path map used by the HTTP view; without
+# it the map would gain an entry per thumbnail ever requested. Evicted
+# ids are re-registered on the next get_thumbnail call for that media.
+THUMBNAIL_ID_MAP_SIZE = 10000
 
-def get_version(hass: HomeAssistant) -> str:
-    """Get version from manifest."""
-    manifest_path = hass.config.path("custom_components/lookout_gallery/manifest.json")
-    try:
-        with open(manifest_path, "r") as fp:
-            manifest = json.load(fp)
-            return manifest.get("version", "0.0.0")
-    except Exception:
-        return "0.0.0"
+
+class LookoutThumbnailView(HomeAssistantView):
+    """Stream generated thumbnails over plain HTTP.
+
+    Serving the JPEG directly avoids the base64 round-trip (33% larger
+    payload plus encode CPU) and lets aiohttp use sendfile from the page
+    cache. Ids are resolved to paths via the get_thumbnail websocket
+    command first, so only known thumbnails are served.
+    """
+
+    url = f"{THUMBNAIL_URL_BASE}/{{thumb_id}}"
+    name = "api:lookout_gallery:thumb"
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the view."""
+        self.hass = hass
+
+    async def get(self, request: web.Request, thumb_id: str) -> web.StreamResponse:
+        """Return the thumbnail file for a previously resolved id."""
+        thumb_path = self.hass.data.get(DOMAIN, {}).get("thumbnails", {}).get(thumb_id)
+
+        if not thumb_path or not os.path.exists(thumb_path):
+            raise web.HTTPNotFound()
+
+        # The id hashes the thumbnail's mtime along with its path, so a
+        # regenerated thumbnail gets a new URL and this one can be cached
+        # forever without ever serving stale content
+        return web.FileResponse(
+            thumb_path,
+            headers={"Cache-Control": "public, max-age=31536000, immutable"},
+        )
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
@@ -61,8 +107,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Lookout Gallery from a config entry."""
     hass.data.setdefault(DOMAIN, {})
 
-    # Get version for cache busting
-    version = await hass.async_add_executor_job(get_version, hass)
+    # Version for cache busting; const.VERSION tracks the manifest, so no
+    # disk read is needed at setup
+    version = VERSION
 
     # Register the frontend JavaScript file (only once)
     if "frontend_loaded" not in hass.data[DOMAIN]:
@@ -91,7 +138,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if isinstance(media_paths, str):
         media_paths = [media_paths]
 
-    # Create thumbnail generator
+    # Create thumbnail generator with a restart-surviving path cache
+    store = ThumbnailCacheStore(hass, hass.config.path(f".storage/{DB_FILENAME}"))
     generator = ThumbnailGenerator(
         hass=hass,
         media_paths=media_paths,
@@ -100,6 +148,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         quality=config_data.get(CONF_THUMBNAIL_QUALITY, DEFAULT_THUMBNAIL_QUALITY),
         frame_position=config_data.get(CONF_FRAME_POSITION, DEFAULT_FRAME_POSITION),
         thumbnail_folder=config_data.get(CONF_THUMBNAIL_FOLDER, DEFAULT_THUMBNAIL_FOLDER),
+        max_concurrency=config_data.get(CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY),
+        cache_size=config_data.get(CONF_CACHE_SIZE, DEFAULT_CACHE_SIZE),
+        store=store,
     )
 
     # Check ffmpeg availability
@@ -111,6 +162,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         "config": config_data,
     }
 
+    # Register the thumbnail HTTP view (only once)
+    if "thumbnail_view" not in hass.data[DOMAIN]:
+        hass.http.register_view(LookoutThumbnailView(hass))
+        hass.data[DOMAIN]["thumbnail_view"] = True
+
     # Register WebSocket API
     websocket_api.async_register_command(hass, websocket_get_thumbnail)
     websocket_api.async_register_command(hass, websocket_generate_thumbnails)
@@ -146,12 +202,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     # Auto-generate thumbnails on startup if enabled
     if config_data.get(CONF_AUTO_GENERATE, DEFAULT_AUTO_GENERATE):
-        async def generate_on_startup(_: Any = None) -> None:
-            """Generate thumbnails after startup."""
-            await asyncio.sleep(60)  # Wait 60 seconds after startup
+        async def generate_on_startup(_: HomeAssistant) -> None:
+            """Generate thumbnails once Home Assistant has fully started."""
             await generator.async_generate_all_thumbnails()
 
-        hass.async_create_task(generate_on_startup())
+        # async_at_started fires as soon as startup completes (or right
+        # away if it already has, e.g. after an entry reload), and the
+        # unload hook cancels it instead of leaving a dangling task
+        entry.async_on_unload(async_at_started(hass, generate_on_startup))
 
     # Update listener
     entry.async_on_unload(entry.add_update_listener(async_update_options))
@@ -170,8 +228,11 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if entry.entry_id in hass.data[DOMAIN]:
         hass.data[DOMAIN].pop(entry.entry_id)
 
-    # Remove services if no entries left
-    if not hass.data[DOMAIN]:
+    # Drop shared state and services once the last entry is gone; the
+    # plain truthiness check never fired because marker keys like
+    # "frontend_loaded" stay behind
+    if _get_generator(hass) is None:
+        hass.data[DOMAIN].pop("thumbnails", None)
         hass.services.async_remove(DOMAIN, "generate_thumbnails")
         hass.services.async_remove(DOMAIN, "clear_cache")
 
@@ -191,6 +252,7 @@ def _get_generator(hass: HomeAssistant) -> ThumbnailGenerator | None:
     {
         vol.Required("type"): "lookout_gallery/get_thumbnail",
         vol.Required("media_content_id"): str,
+        vol.Optional("format", default="url"): vol.In(["url", "base64"]),
     }
 )
 @websocket_api.async_response
@@ -216,18 +278,61 @@ async def websocket_get_thumbnail(
         thumb_path = await generator.async_get_thumbnail(media_content_id)
         
         if thumb_path and os.path.exists(thumb_path):
-            # Read thumbnail and encode as base64
-            def read_thumbnail() -> str:
-                with open(thumb_path, "rb") as f:
-                    return base64.b64encode(f.read()).decode("utf-8")
-            
-            thumb_data = await hass.async_add_executor_job(read_thumbnail)
-            
+            if msg["format"] == "base64":
+                # Legacy path for older cards: read and encode in Python.
+                # pybase64 encodes with SIMD and skips the bytes.decode copy.
+                def encode_thumbnail(data: bytes) -> str:
+                    if pybase64 is not None:
+                        return pybase64.b64encode_as_string(data)
+                    return base64.b64encode(data).decode("utf-8")
+
+                if aiofiles is not None:
+                    # Async read keeps many parallel requests from each
+                    # pinning an executor slot for the whole file read
+                    async with aiofiles.open(thumb_path, "rb") as f:
+                        thumb_data = encode_thumbnail(await f.read())
+                else:
+
+                    def read_thumbnail() -> str:
+                        with open(thumb_path, "rb") as f:
+                            return encode_thumbnail(f.read())
+
+                    thumb_data = await hass.async_add_executor_job(read_thumbnail)
+
+                connection.send_result(
+                    msg["id"],
+                    {
+                        "success": True,
+                        "thumbnail": thumb_data,
+                        "content_type": "image/jpeg",
+                    },
+                )
+                return
+
+            # Register the path under an id and let the browser fetch the
+            # raw JPEG over HTTP (cacheable, no base64 inflation). The id
+            # includes the file's mtime so a regenerated thumbnail (same
+            # path, new content) gets a new URL instead of hitting the
+            # browser's immutable-cached copy of the old one.
+            # LRU-bounded like the generator's path cache.
+            try:
+                thumb_mtime = os.path.getmtime(thumb_path)
+            except OSError:
+                thumb_mtime = 0.0
+            thumb_id = hashlib.md5(
+                f"{thumb_path}:{thumb_mtime}".encode()
+            ).hexdigest()
+            id_map = hass.data[DOMAIN].setdefault("thumbnails", OrderedDict())
+            id_map[thumb_id] = thumb_path
+            id_map.move_to_end(thumb_id)
+            while len(id_map) > THUMBNAIL_ID_MAP_SIZE:
+                id_map.popitem(last=False)
+
             connection.send_result(
                 msg["id"],
                 {
                     "success": True,
-                    "thumbnail": thumb_data,
+                    "url": f"{THUMBNAIL_URL_BASE}/{thumb_id}",
                     "content_type": "image/jpeg",
                 },
             )
@@ -0,0 +1,106 @@
+"""Persistent thumbnail path cache for Lookout Gallery."""
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+DB_FILENAME = "lookout_gallery_cache.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS thumbnails (
+    media_path TEXT PRIMARY KEY,
+    thumb_path TEXT NOT NULL,
+    src_mtime REAL NOT NULL DEFAULT 0
+)
+"""
+
+
+class ThumbnailCacheStore:
+    """SQLite-backed store of media path -> thumbnail path mappings.
+
+    Acts as the secondary cache behind the in-memory dict: it survives
+    restarts, so resolved mappings are available immediately after Home
+    Assistant starts. Each entry records the source mtime seen at
+    generation time, which the hit path compares against the current one
+    to catch media files replaced in place. All database access runs in
+    the executor since sqlite3 is blocking.
+    """
+
+    def __init__(self, hass: HomeAssistant, db_path: str) -> None:
+        """Initialize the store."""
+        self.hass = hass
+        self.db_path = db_path
+        self._conn: sqlite3.Connection | None = None
+        self._conn_lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open (or reuse) the database connection (runs in executor).
+
+        Guarded by a lock: executor jobs run on multiple threads, and
+        two first uses racing here would each open a connection and
+        leak one of them.
+        """
+        with self._conn_lock:
+            if self._conn is None:
+                os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+                self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute(_SCHEMA)
+                self._conn.commit()
+            return self._conn
+
+    def _load(self) -> dict[str, tuple[str, float]]:
+        """Read all cached mappings (runs in executor)."""
+        conn = self._connect()
+        return {
+            media_path: (thumb_path, src_mtime)
+            for media_path, thumb_path, src_mtime in conn.execute(
+                "SELECT media_path, thumb_path, src_mtime FROM thumbnails"
+            )
+        }
+
+    def _set(self, media_path: str, thumb_path: str, src_mtime: float) -> None:
+        """Insert or update one mapping (runs in executor)."""
+        conn = self._connect()
+        conn.execute(
+            "INSERT OR REPLACE INTO thumbnails "
+            "(media_path, thumb_path, src_mtime) VALUES (?, ?, ?)",
+            (media_path, thumb_path, src_mtime),
+        )
+        conn.commit()
+
+    def _clear(self) -> None:
+        """Delete all mappings (runs in executor)."""
+        conn = self._connect()
+        conn.execute("DELETE FROM thumbnails")
+        conn.commit()
+
+    async def async_load(self) -> dict[str, tuple[str, float]]:
+        """Load all cached mappings."""
+        return await self.hass.async_add_executor_job(self._load)
+
+    async def async_set(
+        self, media_path: str, thumb_path: str, src_mtime: float
+    ) -> None:
+        """Persist one mapping."""
+        try:
+            await self.hass.async_add_executor_job(
+                self._set, media_path, thumb_path, src_mtime
+            )
+        except sqlite3.Error as ex:
+            _LOGGER.debug("Could not persist thumbnail cache entry: %s", ex)
+
+    async def async_clear(self) -> None:
+        """Remove all persisted mappings."""
+        try:
+            await self.hass.async_add_executor_job(self._clear)
+        except sqlite3.Error as ex:
+            _LOGGER.debug("Could not clear thumbnail cache: %s", ex)
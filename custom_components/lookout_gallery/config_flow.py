@@ -1,6 +1,7 @@
 """Config flow for Lookout Gallery integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 from typing import Any
@@ -8,19 +9,23 @@ from typing import Any
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.core import callback
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 
 from .const import (
     CONF_AUTO_GENERATE,
+    CONF_CACHE_SIZE,
     CONF_FRAME_POSITION,
+    CONF_MAX_CONCURRENCY,
     CONF_MEDIA_PATHS,
     CONF_THUMBNAIL_FOLDER,
     CONF_THUMBNAIL_HEIGHT,
     CONF_THUMBNAIL_QUALITY,
     CONF_THUMBNAIL_WIDTH,
     DEFAULT_AUTO_GENERATE,
+    DEFAULT_CACHE_SIZE,
     DEFAULT_FRAME_POSITION,
+    DEFAULT_MAX_CONCURRENCY,
     DEFAULT_THUMBNAIL_FOLDER,
     DEFAULT_THUMBNAIL_HEIGHT,
     DEFAULT_THUMBNAIL_QUALITY,
@@ -31,14 +36,20 @@ from .const import (
 _LOGGER = logging.getLogger(__name__)
 
 
-def validate_media_paths(paths: list[str]) -> list[str]:
-    """Validate media paths exist."""
-    valid_paths = []
-    for path in paths:
-        path = path.strip()
-        if path and os.path.isdir(path):
-            valid_paths.append(path)
-    return valid_paths
+async def async_validate_media_paths(
+    hass: HomeAssistant, paths: list[str]
+) -> list[str]:
+    """Validate media paths exist, checking them concurrently.
+
+    Each stat on a network mount (NFS/SMB) can block for hundreds of ms,
+    so the checks are gathered: the flow waits for the slowest path
+    instead of the sum of all of them.
+    """
+    paths = [path.strip() for path in paths if path.strip()]
+    results = await asyncio.gather(
+        *(hass.async_add_executor_job(os.path.isdir, path) for path in paths)
+    )
+    return [path for path, is_dir in zip(paths, results) if is_dir]
 
 
 class LookoutGalleryConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -56,9 +67,7 @@ class LookoutGalleryConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             paths_str = user_input.get(CONF_MEDIA_PATHS, "/media")
             paths = [p.strip() for p in paths_str.split(",") if p.strip()]
             
-            valid_paths = await self.hass.async_add_executor_job(
-                validate_media_paths, paths
-            )
+            valid_paths = await async_validate_media_paths(self.hass, paths)
             
             if not valid_paths:
                 errors[CONF_MEDIA_PATHS] = "no_valid_paths"
@@ -76,6 +85,8 @@ class LookoutGalleryConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         CONF_FRAME_POSITION: user_input.get(CONF_FRAME_POSITION, DEFAULT_FRAME_POSITION),
                         CONF_THUMBNAIL_FOLDER: user_input.get(CONF_THUMBNAIL_FOLDER, DEFAULT_THUMBNAIL_FOLDER),
                         CONF_AUTO_GENERATE: user_input.get(CONF_AUTO_GENERATE, DEFAULT_AUTO_GENERATE),
+                        CONF_MAX_CONCURRENCY: user_input.get(CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY),
+                        CONF_CACHE_SIZE: user_input.get(CONF_CACHE_SIZE, DEFAULT_CACHE_SIZE),
                     },
                 )
 
@@ -94,6 +105,8 @@ class LookoutGalleryConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     vol.Optional(CONF_FRAME_POSITION, default=DEFAULT_FRAME_POSITION): vol.All(vol.Coerce(float), vol.Range(min=0.0, max=10.0)),
                     vol.Optional(CONF_THUMBNAIL_FOLDER, default=DEFAULT_THUMBNAIL_FOLDER): str,
                     vol.Optional(CONF_AUTO_GENERATE, default=DEFAULT_AUTO_GENERATE): bool,
+                    vol.Optional(CONF_MAX_CONCURRENCY, default=DEFAULT_MAX_CONCURRENCY): vol.All(vol.Coerce(int), vol.Range(min=0, max=16)),
+                    vol.Optional(CONF_CACHE_SIZE, default=DEFAULT_CACHE_SIZE): vol.All(vol.Coerce(int), vol.Range(min=100, max=100000)),
                 }
             ),
             errors=errors,
@@ -116,7 +129,7 @@ class LookoutGalleryOptionsFlow(config_entries.OptionsFlow):
         if user_input is not None:
             paths_str = user_input.get(CONF_MEDIA_PATHS, "/media")
             paths = [p.strip() for p in paths_str.split(",") if p.strip()]
-            valid_paths = await self.hass.async_add_executor_job(validate_media_paths, paths)
+            valid_paths = await async_validate_media_paths(self.hass, paths)
 
             if not valid_paths:
                 errors[CONF_MEDIA_PATHS] = "no_valid_paths"
@@ -131,6 +144,8 @@ class LookoutGalleryOptionsFlow(config_entries.OptionsFlow):
                         CONF_FRAME_POSITION: user_input.get(CONF_FRAME_POSITION, DEFAULT_FRAME_POSITION),
                         CONF_THUMBNAIL_FOLDER: user_input.get(CONF_THUMBNAIL_FOLDER, DEFAULT_THUMBNAIL_FOLDER),
                         CONF_AUTO_GENERATE: user_input.get(CONF_AUTO_GENERATE, DEFAULT_AUTO_GENERATE),
+                        CONF_MAX_CONCURRENCY: user_input.get(CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY),
+                        CONF_CACHE_SIZE: user_input.get(CONF_CACHE_SIZE, DEFAULT_CACHE_SIZE),
                     },
                 )
 
@@ -150,6 +165,8 @@ class LookoutGalleryOptionsFlow(config_entries.OptionsFlow):
                     vol.Optional(CONF_FRAME_POSITION, default=current.get(CONF_FRAME_POSITION, DEFAULT_FRAME_POSITION)): vol.All(vol.Coerce(float), vol.Range(min=0.0, max=10.0)),
                     vol.Optional(CONF_THUMBNAIL_FOLDER, default=current.get(CONF_THUMBNAIL_FOLDER, DEFAULT_THUMBNAIL_FOLDER)): str,
                     vol.Optional(CONF_AUTO_GENERATE, default=current.get(CONF_AUTO_GENERATE, DEFAULT_AUTO_GENERATE)): bool,
+                    vol.Optional(CONF_MAX_CONCURRENCY, default=current.get(CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY)): vol.All(vol.Coerce(int), vol.Range(min=0, max=16)),
+                    vol.Optional(CONF_CACHE_SIZE, default=current.get(CONF_CACHE_SIZE, DEFAULT_CACHE_SIZE)): vol.All(vol.Coerce(int), vol.Range(min=100, max=100000)),
                 }
             ),
             errors=errors,
@@ -1,7 +1,7 @@
 """Constants for Lookout Gallery integration."""
 
 DOMAIN = "lookout_gallery"
-VERSION = "1.0.0"
+VERSION = "1.0.7"
 
 # Config keys
 CONF_MEDIA_PATHS = "media_paths"
@@ -11,6 +11,8 @@ CONF_THUMBNAIL_QUALITY = "thumbnail_quality"
 CONF_FRAME_POSITION = "frame_position"
 CONF_THUMBNAIL_FOLDER = "thumbnail_folder"
 CONF_AUTO_GENERATE = "auto_generate"
+CONF_MAX_CONCURRENCY = "max_concurrency"
+CONF_CACHE_SIZE = "cache_size"
 
 # Defaults
 DEFAULT_THUMBNAIL_WIDTH = 320
@@ -19,6 +21,8 @@ DEFAULT_THUMBNAIL_QUALITY = 70
 DEFAULT_FRAME_POSITION = 0.5
 DEFAULT_THUMBNAIL_FOLDER = ".thumbnails"
 DEFAULT_AUTO_GENERATE = True
+DEFAULT_MAX_CONCURRENCY = 0  # 0 = auto (number of CPU cores)
+DEFAULT_CACHE_SIZE = 10000
 
 # Supported extensions
 VIDEO_EXTENSIONS = {".mp4", ".mkv", ".avi", ".mov", ".webm", ".m4v", ".ts"}
@@ -1008,8 +1008,16 @@ class LookoutGalleryCard extends LitElement {
         media_content_id: contentId
       });
       
+      if (result.success && result.url) {
+        // Server streams the raw JPEG; fetch with auth and wrap in a blob URL
+        const response = await this.hass.fetchWithAuth(result.url);
+        if (!response.ok) return null;
+        const blob = await response.blob();
+        return URL.createObjectURL(blob);
+      }
+
       if (result.success && result.thumbnail) {
-        // Convert base64 to blob URL
+        // Legacy base64 response from older integration versions
         const binary = atob(result.thumbnail);
         const bytes = new Uint8Array(binary.length);
         for (let i = 0; i < binary.length; i++) {
@@ -2,14 +2,24 @@
 from __future__ import annotations
 
 import asyncio
-import hashlib
 import logging
 import os
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import xxhash
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    Image = None
+
 from .const import (
+    DEFAULT_CACHE_SIZE,
     DEFAULT_FRAME_POSITION,
+    DEFAULT_MAX_CONCURRENCY,
     DEFAULT_THUMBNAIL_FOLDER,
     DEFAULT_THUMBNAIL_HEIGHT,
     DEFAULT_THUMBNAIL_QUALITY,
@@ -21,8 +31,70 @@ from .const import (
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
+    from .cache import ThumbnailCacheStore
+
 _LOGGER = logging.getLogger(__name__)
 
+# Videos per batched ffmpeg invocation; amortizes process startup cost
+FFMPEG_BATCH_SIZE = 8
+
+
+@lru_cache(maxsize=8192)
+def _hash8(media_path: str) -> str:
+    """Short unique hash for thumbnail names; memoized for repeat scans.
+
+    xxh64 is a non-cryptographic hash roughly 15-20x faster than MD5,
+    which is all a short unique name needs. The path is encoded
+    explicitly rather than leaning on the library's str handling.
+    """
+    return xxhash.xxh64_hexdigest(media_path.encode())[:8]
+
+
+def _is_video(path: str) -> bool:
+    """Check if file is a video."""
+    return os.path.splitext(path)[1].lower() in VIDEO_EXTENSIONS
+
+
+def _is_image(path: str) -> bool:
+    """Check if file is an image."""
+    return os.path.splitext(path)[1].lower() in IMAGE_EXTENSIONS
+
+
+def _discard_tmp(path: str) -> None:
+    """Best-effort removal of a partially written temp file."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _pillow_image_thumbnail(
+    src: str, dst: str, width: int, height: int, quality: int
+) -> None:
+    """Resize an image with Pillow (runs in executor).
+
+    In-process decode+resize+encode is far cheaper than spawning ffmpeg
+    for a single image. draft() lets the JPEG decoder skip DCT blocks it
+    does not need for the target size. ImageOps.pad letterboxes onto a
+    width x height black canvas, matching the scale+pad filter the
+    ffmpeg paths use, so every thumbnail has the same geometry no
+    matter which generator produced it. Written via temp file + rename
+    so a crash mid-write never leaves a truncated thumbnail behind.
+    """
+    tmp = f"{dst}.tmp"
+    try:
+        with Image.open(src) as im:
+            im.draft("RGB", (width * 2, height * 2))
+            im = im.convert("RGB")
+            im = ImageOps.pad(
+                im, (width, height), Image.Resampling.LANCZOS, color="black"
+            )
+            im.save(tmp, "JPEG", quality=quality, optimize=True)
+        os.replace(tmp, dst)
+    except Exception:
+        _discard_tmp(tmp)
+        raise
+
 
 class ThumbnailGenerator:
     """Generate and manage thumbnails for media files."""
@@ -36,6 +108,9 @@ class ThumbnailGenerator:
         quality: int = DEFAULT_THUMBNAIL_QUALITY,
         frame_position: float = DEFAULT_FRAME_POSITION,
         thumbnail_folder: str = DEFAULT_THUMBNAIL_FOLDER,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        store: ThumbnailCacheStore | None = None,
     ) -> None:
         """Initialize the thumbnail generator."""
         self.hass = hass
@@ -45,59 +120,113 @@ class ThumbnailGenerator:
         self.quality = quality
         self.frame_position = frame_position
         self.thumbnail_folder = thumbnail_folder
+        self.max_concurrency = max_concurrency or os.cpu_count() or 2
+        # Precomputed ffmpeg arguments, shared by every invocation; the
+        # quality value is clamped to mjpeg's valid 2-31 range
+        self._vf_filter = (
+            f"scale={width}:{height}:force_original_aspect_ratio=decrease,"
+            f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2"
+        )
+        self._qv = str(max(2, min(31, int((100 - quality) / 3.33))))
         self._ffmpeg_available: bool | None = None
-        self._cache: dict[str, str] = {}
+        self._ffmpeg_lock = asyncio.Lock()
+        # LRU-bounded map of media path -> (thumb path, source mtime at
+        # generation time); most recently used entries stay at the end
+        self.cache_size = max(1, cache_size)
+        self._cache: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._store = store
+        self._cache_loaded = store is None
 
     async def async_check_ffmpeg(self) -> bool:
-        """Check if ffmpeg is available."""
+        """Check if ffmpeg is available (probed at most once)."""
         if self._ffmpeg_available is not None:
             return self._ffmpeg_available
 
-        try:
-            process = await asyncio.create_subprocess_exec(
-                "ffmpeg", "-version",
-                stdout=asyncio.subprocess.DEVNULL,
-                stderr=asyncio.subprocess.DEVNULL,
-            )
-            await process.wait()
-            self._ffmpeg_available = process.returncode == 0
-        except FileNotFoundError:
-            self._ffmpeg_available = False
+        async with self._ffmpeg_lock:
+            # Another coroutine may have finished the probe while we waited
+            if self._ffmpeg_available is not None:
+                return self._ffmpeg_available
 
-        if not self._ffmpeg_available:
-            _LOGGER.warning("ffmpeg not found - thumbnail generation disabled")
-        else:
-            _LOGGER.info("ffmpeg found - thumbnail generation enabled")
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    "ffmpeg", "-version",
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.DEVNULL,
+                )
+                await process.wait()
+                available = process.returncode == 0
+            except FileNotFoundError:
+                available = False
+
+            if not available:
+                _LOGGER.warning("ffmpeg not found - thumbnail generation disabled")
+            else:
+                _LOGGER.info("ffmpeg found - thumbnail generation enabled")
+
+            self._ffmpeg_available = available
 
         return self._ffmpeg_available
 
-    def _get_thumbnail_path(self, media_path: str) -> Path:
-        """Get the thumbnail path for a media file."""
-        media_file = Path(media_path)
-        
-        # Create hash for unique thumbnail name
-        path_hash = hashlib.md5(media_path.encode()).hexdigest()[:8]
-        thumb_name = f"{media_file.stem}_{path_hash}.jpg"
-        
-        # Thumbnail folder is relative to the media file's directory
-        thumb_dir = media_file.parent / self.thumbnail_folder
-        return thumb_dir / thumb_name
-
-    def _is_video(self, path: str) -> bool:
-        """Check if file is a video."""
-        return Path(path).suffix.lower() in VIDEO_EXTENSIONS
-
-    def _is_image(self, path: str) -> bool:
-        """Check if file is an image."""
-        return Path(path).suffix.lower() in IMAGE_EXTENSIONS
+    def _video_input_args(self) -> list[str]:
+        """Build the ffmpeg options placed before each video input.
+
+        -hwaccel auto uses a hardware decoder when one actually works and
+        silently falls back to software otherwise; probing -hwaccels is
+        useless here because it lists compiled-in methods that fail at
+        runtime on GPU-less hosts. Input-side -ss with -noaccurate_seek
+        jumps to the nearest keyframe instead of decoding from the start,
+        and -skip_frame nokey keeps the decoder from touching non-key
+        frames at all.
+        """
+        return [
+            "-hwaccel", "auto",
+            "-skip_frame", "nokey",
+            "-noaccurate_seek",
+            "-ss", str(self.frame_position),
+        ]
+
+    def _get_thumbnail_path(self, media_path: str) -> str:
+        """Get the thumbnail path for a media file.
+
+        Plain string ops instead of pathlib: Path construction allocates
+        several small objects per call, which adds up across a scan.
+        """
+        directory, name = os.path.split(media_path)
+        stem = os.path.splitext(name)[0]
+
+        # Thumbnail folder is relative to the media file's directory;
+        # the hash keeps the name unique (memoized in _hash8)
+        return os.path.join(
+            directory, self.thumbnail_folder, f"{stem}_{_hash8(media_path)}.jpg"
+        )
+
+    async def _async_ensure_cache(self) -> None:
+        """Load the persisted thumbnail cache once per process."""
+        if self._cache_loaded:
+            return
+        self._cache_loaded = True
+        try:
+            self._cache.update(await self._store.async_load())
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+            _LOGGER.debug("Loaded %d cached thumbnail paths", len(self._cache))
+        except Exception as ex:
+            _LOGGER.warning("Could not load persisted thumbnail cache: %s", ex)
+
+    def _remember(self, media_path: str, thumb_path: str, src_mtime: float) -> None:
+        """Cache a resolved thumbnail in memory and, if available, on disk."""
+        self._cache[media_path] = (thumb_path, src_mtime)
+        self._cache.move_to_end(media_path)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        if self._store is not None:
+            self.hass.async_create_task(
+                self._store.async_set(media_path, thumb_path, src_mtime)
+            )
 
     async def async_get_thumbnail(self, media_path: str) -> str | None:
         """Get or generate thumbnail for a media file."""
-        # Check cache first
-        if media_path in self._cache:
-            thumb_path = self._cache[media_path]
-            if os.path.exists(thumb_path):
-                return thumb_path
+        await self._async_ensure_cache()
 
         # Resolve actual file path
         actual_path = self._resolve_media_path(media_path)
@@ -105,26 +234,43 @@ class ThumbnailGenerator:
             _LOGGER.debug("Media file not found: %s", media_path)
             return None
 
+        try:
+            src_mtime = os.path.getmtime(actual_path)
+        except OSError:
+            src_mtime = 0.0
+
+        # A cache hit (in-memory or persisted) is only trusted while the
+        # source mtime matches the one recorded at generation time, so a
+        # media file replaced in place gets a fresh thumbnail
+        cached = self._cache.get(media_path)
+        if cached is not None:
+            cached_thumb, cached_mtime = cached
+            if cached_mtime == src_mtime and os.path.exists(cached_thumb):
+                self._cache.move_to_end(media_path)
+                return cached_thumb
+
         thumb_path = self._get_thumbnail_path(actual_path)
 
-        # Check if thumbnail already exists
-        if thumb_path.exists():
-            if thumb_path.stat().st_mtime >= Path(actual_path).stat().st_mtime:
-                self._cache[media_path] = str(thumb_path)
-                return str(thumb_path)
+        # Check if thumbnail already exists and is up to date
+        try:
+            if os.path.getmtime(thumb_path) >= src_mtime:
+                self._remember(media_path, thumb_path, src_mtime)
+                return thumb_path
+        except OSError:
+            pass
 
         # Generate thumbnail
-        if self._is_video(actual_path):
+        if _is_video(actual_path):
             success = await self._generate_video_thumbnail(actual_path, thumb_path)
-        elif self._is_image(actual_path):
+        elif _is_image(actual_path):
             success = await self._generate_image_thumbnail(actual_path, thumb_path)
         else:
             _LOGGER.debug("Unsupported file type: %s", actual_path)
             return None
 
         if success:
-            self._cache[media_path] = str(thumb_path)
-            return str(thumb_path)
+            self._remember(media_path, thumb_path, src_mtime)
+            return thumb_path
 
         return None
 
@@ -155,23 +301,27 @@ class ThumbnailGenerator:
 
         return None
 
-    async def _generate_video_thumbnail(self, video_path: str, thumb_path: Path) -> bool:
+    async def _generate_video_thumbnail(self, video_path: str, thumb_path: str) -> bool:
         """Generate thumbnail from video using ffmpeg."""
         if not await self.async_check_ffmpeg():
             return False
 
-        thumb_path.parent.mkdir(parents=True, exist_ok=True)
+        os.makedirs(os.path.dirname(thumb_path), exist_ok=True)
 
+        # Write to a temp file and rename so a killed ffmpeg never leaves
+        # a truncated thumbnail that would be served as valid
+        tmp_path = f"{thumb_path}.tmp"
         try:
             cmd = [
                 "ffmpeg",
                 "-y",
-                "-ss", str(self.frame_position),
+                *self._video_input_args(),
                 "-i", video_path,
                 "-vframes", "1",
-                "-vf", f"scale={self.width}:{self.height}:force_original_aspect_ratio=decrease,pad={self.width}:{self.height}:(ow-iw)/2:(oh-ih)/2",
-                "-q:v", str(int((100 - self.quality) / 3.33)),
-                str(thumb_path),
+                "-vf", self._vf_filter,
+                "-q:v", self._qv,
+                "-f", "image2",
+                tmp_path,
             ]
 
             process = await asyncio.create_subprocess_exec(
@@ -182,6 +332,7 @@ class ThumbnailGenerator:
             _, stderr = await asyncio.wait_for(process.communicate(), timeout=30)
 
             if process.returncode != 0:
+                _discard_tmp(tmp_path)
                 # Only log as debug for corrupt files (moov atom not found is common)
                 error_msg = stderr.decode() if stderr else "Unknown error"
                 if "moov atom not found" in error_msg or "Invalid data found" in error_msg:
@@ -190,31 +341,191 @@ class ThumbnailGenerator:
                     _LOGGER.warning("ffmpeg failed for %s: %s", video_path, error_msg)
                 return False
 
+            os.replace(tmp_path, thumb_path)
             _LOGGER.debug("Generated thumbnail for: %s", video_path)
             return True
 
         except asyncio.TimeoutError:
+            _discard_tmp(tmp_path)
             _LOGGER.debug("Thumbnail generation timed out for: %s", video_path)
             return False
         except Exception as ex:
+            _discard_tmp(tmp_path)
             _LOGGER.error("Error generating thumbnail for %s: %s", video_path, ex)
             return False
 
-    async def _generate_image_thumbnail(self, image_path: str, thumb_path: Path) -> bool:
-        """Generate thumbnail from image using ffmpeg."""
+    async def _generate_video_thumbnails_batch(
+        self, batch: list[tuple[str, str]]
+    ) -> list[bool]:
+        """Generate thumbnails for several videos in one ffmpeg invocation.
+
+        Process startup alone costs hundreds of ms per ffmpeg run; mapping
+        each input to its own single-frame output amortizes that across the
+        batch. Falls back to per-file generation if the batched run fails
+        (e.g. one corrupt input aborts the whole invocation).
+        """
         if not await self.async_check_ffmpeg():
-            return False
+            return [False] * len(batch)
+
+        if len(batch) == 1:
+            video_path, thumb_path = batch[0]
+            return [await self._generate_video_thumbnail(video_path, thumb_path)]
 
-        thumb_path.parent.mkdir(parents=True, exist_ok=True)
+        for _, thumb_path in batch:
+            os.makedirs(os.path.dirname(thumb_path), exist_ok=True)
 
+        tmp_paths = [f"{thumb_path}.tmp" for _, thumb_path in batch]
+        try:
+            cmd = ["ffmpeg", "-y"]
+            for video_path, _ in batch:
+                cmd += [*self._video_input_args(), "-i", video_path]
+            for index, tmp_path in enumerate(tmp_paths):
+                cmd += [
+                    "-map", f"{index}:v",
+                    "-vframes", "1",
+                    "-vf", self._vf_filter,
+                    "-q:v", self._qv,
+                    "-f", "image2",
+                    tmp_path,
+                ]
+
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            _, stderr = await asyncio.wait_for(
+                process.communicate(), timeout=30 * len(batch)
+            )
+
+            if process.returncode == 0:
+                for tmp_path, (_, thumb_path) in zip(tmp_paths, batch):
+                    os.replace(tmp_path, thumb_path)
+                _LOGGER.debug("Generated %d thumbnails in one ffmpeg run", len(batch))
+                return [True] * len(batch)
+
+            _LOGGER.debug(
+                "Batched ffmpeg run failed, retrying per file: %s",
+                stderr.decode() if stderr else "Unknown error",
+            )
+
+        except asyncio.TimeoutError:
+            _LOGGER.debug("Batched thumbnail generation timed out, retrying per file")
+        except Exception as ex:
+            _LOGGER.error("Error in batched thumbnail generation: %s", ex)
+
+        for tmp_path in tmp_paths:
+            _discard_tmp(tmp_path)
+
+        return [
+            await self._generate_video_thumbnail(video_path, thumb_path)
+            for video_path, thumb_path in batch
+        ]
+
+    async def _generate_image_thumbnails_batch(
+        self, batch: list[tuple[str, str]]
+    ) -> list[bool]:
+        """Generate thumbnails for several images in one ffmpeg invocation.
+
+        Same startup amortization as the video batch path: ffmpeg cannot be
+        kept alive as a persistent worker (it has no job protocol), but one
+        process can resize many inputs via per-output -map.
+        """
+        # With Pillow available the per-image path is already in-process and
+        # cheap - no process startup left to amortize
+        if Image is not None or len(batch) == 1:
+            return [
+                await self._generate_image_thumbnail(image_path, thumb_path)
+                for image_path, thumb_path in batch
+            ]
+
+        if not await self.async_check_ffmpeg():
+            return [False] * len(batch)
+
+        for _, thumb_path in batch:
+            os.makedirs(os.path.dirname(thumb_path), exist_ok=True)
+
+        tmp_paths = [f"{thumb_path}.tmp" for _, thumb_path in batch]
+        try:
+            cmd = ["ffmpeg", "-y"]
+            for image_path, _ in batch:
+                cmd += ["-i", image_path]
+            for index, tmp_path in enumerate(tmp_paths):
+                cmd += [
+                    "-map", f"{index}:v",
+                    "-frames:v", "1",
+                    "-vf", self._vf_filter,
+                    "-q:v", self._qv,
+                    "-f", "image2",
+                    tmp_path,
+                ]
+
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            _, stderr = await asyncio.wait_for(
+                process.communicate(), timeout=15 * len(batch)
+            )
+
+            if process.returncode == 0:
+                for tmp_path, (_, thumb_path) in zip(tmp_paths, batch):
+                    os.replace(tmp_path, thumb_path)
+                _LOGGER.debug("Generated %d image thumbnails in one ffmpeg run", len(batch))
+                return [True] * len(batch)
+
+            _LOGGER.debug(
+                "Batched image ffmpeg run failed, retrying per file: %s",
+                stderr.decode() if stderr else "Unknown error",
+            )
+
+        except asyncio.TimeoutError:
+            _LOGGER.debug("Batched image thumbnail generation timed out, retrying per file")
+        except Exception as ex:
+            _LOGGER.error("Error in batched image thumbnail generation: %s", ex)
+
+        for tmp_path in tmp_paths:
+            _discard_tmp(tmp_path)
+
+        return [
+            await self._generate_image_thumbnail(image_path, thumb_path)
+            for image_path, thumb_path in batch
+        ]
+
+    async def _generate_image_thumbnail(self, image_path: str, thumb_path: str) -> bool:
+        """Generate thumbnail from image using Pillow, with ffmpeg fallback."""
+        os.makedirs(os.path.dirname(thumb_path), exist_ok=True)
+
+        if Image is not None:
+            try:
+                await self.hass.async_add_executor_job(
+                    _pillow_image_thumbnail,
+                    image_path,
+                    thumb_path,
+                    self.width,
+                    self.height,
+                    self.quality,
+                )
+                return True
+            except Exception as ex:
+                _LOGGER.debug(
+                    "Pillow failed for %s, falling back to ffmpeg: %s", image_path, ex
+                )
+
+        if not await self.async_check_ffmpeg():
+            return False
+
+        tmp_path = f"{thumb_path}.tmp"
         try:
             cmd = [
                 "ffmpeg",
                 "-y",
                 "-i", image_path,
-                "-vf", f"scale={self.width}:{self.height}:force_original_aspect_ratio=decrease,pad={self.width}:{self.height}:(ow-iw)/2:(oh-ih)/2",
-                "-q:v", str(int((100 - self.quality) / 3.33)),
-                str(thumb_path),
+                "-vf", self._vf_filter,
+                "-q:v", self._qv,
+                "-f", "image2",
+                tmp_path,
             ]
 
             process = await asyncio.create_subprocess_exec(
@@ -225,15 +536,19 @@ class ThumbnailGenerator:
             _, stderr = await asyncio.wait_for(process.communicate(), timeout=15)
 
             if process.returncode != 0:
+                _discard_tmp(tmp_path)
                 _LOGGER.warning("ffmpeg failed for %s: %s", image_path, stderr.decode() if stderr else "Unknown error")
                 return False
 
+            os.replace(tmp_path, thumb_path)
             return True
 
         except asyncio.TimeoutError:
+            _discard_tmp(tmp_path)
             _LOGGER.warning("Thumbnail generation timed out for: %s", image_path)
             return False
         except Exception as ex:
+            _discard_tmp(tmp_path)
             _LOGGER.error("Error generating thumbnail for %s: %s", image_path, ex)
             return False
 
@@ -248,61 +563,142 @@ class ThumbnailGenerator:
                 _LOGGER.warning("Media path does not exist: %s", base_path)
                 continue
 
-            # Use executor to avoid blocking the event loop
-            file_list = await self.hass.async_add_executor_job(
+            # The scan already filters out up-to-date thumbnails, so only
+            # files needing generation come back from the executor
+            pending, scanned, skipped = await self.hass.async_add_executor_job(
                 self._scan_directory, base_path
             )
+            stats["scanned"] += scanned
+            stats["skipped"] += skipped
 
-            for file_path, ext in file_list:
-                stats["scanned"] += 1
-                thumb_path = self._get_thumbnail_path(file_path)
-
-                # Check if thumbnail exists (in executor)
-                thumb_exists = await self.hass.async_add_executor_job(
-                    self._check_thumbnail_exists, file_path, thumb_path
-                )
-                
-                if thumb_exists:
-                    stats["skipped"] += 1
-                    continue
+            if not pending:
+                continue
 
-                if ext in VIDEO_EXTENSIONS:
-                    success = await self._generate_video_thumbnail(file_path, thumb_path)
-                else:
-                    success = await self._generate_image_thumbnail(file_path, thumb_path)
+            jobs = [
+                (file_path, self._get_thumbnail_path(file_path), ext in VIDEO_EXTENSIONS)
+                for file_path, ext in pending
+            ]
 
-                if success:
-                    stats["generated"] += 1
-                else:
-                    stats["failed"] += 1
+            video_jobs = [(f, t) for f, t, is_video in jobs if is_video]
+            image_jobs = [(f, t) for f, t, is_video in jobs if not is_video]
+
+            # Bounded pool: ffmpeg invocations are independent disk+CPU work,
+            # so run up to max_concurrency of them at once. Both media types
+            # go through batched invocations to amortize ffmpeg startup cost.
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+
+            async def generate_video_batch(
+                batch: list[tuple[str, str]],
+                semaphore: asyncio.Semaphore = semaphore,
+            ) -> list[bool]:
+                async with semaphore:
+                    return await self._generate_video_thumbnails_batch(batch)
+
+            async def generate_image_batch(
+                batch: list[tuple[str, str]],
+                semaphore: asyncio.Semaphore = semaphore,
+            ) -> list[bool]:
+                async with semaphore:
+                    return await self._generate_image_thumbnails_batch(batch)
+
+            tasks = [
+                generate_video_batch(video_jobs[i : i + FFMPEG_BATCH_SIZE])
+                for i in range(0, len(video_jobs), FFMPEG_BATCH_SIZE)
+            ]
+            tasks += [
+                generate_image_batch(image_jobs[i : i + FFMPEG_BATCH_SIZE])
+                for i in range(0, len(image_jobs), FFMPEG_BATCH_SIZE)
+            ]
 
-                # Yield control
-                await asyncio.sleep(0)
+            for future in asyncio.as_completed(tasks):
+                for success in await future:
+                    if success:
+                        stats["generated"] += 1
+                    else:
+                        stats["failed"] += 1
 
         _LOGGER.info("Thumbnail generation: %d scanned, %d generated, %d skipped, %d failed",
                      stats["scanned"], stats["generated"], stats["skipped"], stats["failed"])
 
         return stats
 
-    def _scan_directory(self, base_path: str) -> list[tuple[str, str]]:
-        """Scan directory for media files (runs in executor)."""
-        file_list = []
-        for root, _, files in os.walk(base_path):
-            if self.thumbnail_folder in root:
+    def _scan_directory(
+        self, base_path: str
+    ) -> tuple[list[tuple[str, str]], int, int]:
+        """Scan for media files needing thumbnails (runs in executor).
+
+        Iterative os.scandir keeps the DirEntry, whose stat() result is
+        cached by the kernel readdir pass - os.walk would throw it away
+        and force a second stat syscall per file. Source and thumbnail
+        mtimes are collected into parallel containers per directory and
+        compared in bulk, so the up-to-date filter needs one scandir of
+        the sibling thumbnail folder instead of a stat per file.
+
+        Returns (files needing generation, scanned count, skipped count).
+        """
+        pending: list[tuple[str, str]] = []
+        scanned = 0
+        skipped = 0
+        stack = [base_path]
+        while stack:
+            directory = stack.pop()
+            try:
+                entries = os.scandir(directory)
+            except OSError as ex:
+                _LOGGER.debug("Could not scan %s: %s", directory, ex)
                 continue
-            for filename in files:
-                ext = Path(filename).suffix.lower()
-                if ext in VIDEO_EXTENSIONS or ext in IMAGE_EXTENSIONS:
-                    file_list.append((os.path.join(root, filename), ext))
-        return file_list
-
-    def _check_thumbnail_exists(self, file_path: str, thumb_path: Path) -> bool:
-        """Check if thumbnail exists and is up to date (runs in executor)."""
-        if thumb_path.exists():
-            if thumb_path.stat().st_mtime >= Path(file_path).stat().st_mtime:
-                return True
-        return False
+
+            media: list[tuple[str, str, float]] = []
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        # Prune thumbnail and hidden dirs (.git, .trash, ...)
+                        # here so they are never even opened
+                        if (
+                            entry.name != self.thumbnail_folder
+                            and not entry.name.startswith(".")
+                        ):
+                            stack.append(entry.path)
+                        continue
+                    ext = os.path.splitext(entry.name)[1].lower()
+                    if ext in VIDEO_EXTENSIONS or ext in IMAGE_EXTENSIONS:
+                        try:
+                            mtime = entry.stat(follow_symlinks=False).st_mtime
+                        except OSError:
+                            continue
+                        media.append((entry.path, ext, mtime))
+
+            if not media:
+                continue
+            scanned += len(media)
+
+            thumb_mtimes: dict[str, float] = {}
+            try:
+                with os.scandir(
+                    os.path.join(directory, self.thumbnail_folder)
+                ) as thumbs:
+                    for thumb in thumbs:
+                        try:
+                            thumb_mtimes[thumb.name] = thumb.stat(
+                                follow_symlinks=False
+                            ).st_mtime
+                        except OSError:
+                            continue
+            except OSError:
+                pass  # No thumbnail folder for this directory yet
+
+            for file_path, ext, mtime in media:
+                stem = os.path.splitext(os.path.basename(file_path))[0]
+                thumb_name = f"{stem}_{_hash8(file_path)}.jpg"
+                if thumb_mtimes.get(thumb_name, -1.0) >= mtime:
+                    skipped += 1
+                else:
+                    pending.append((file_path, ext))
+
+        return pending, scanned, skipped
 
     def clear_cache(self) -> None:
-        """Clear the in-memory cache."""
+        """Clear the in-memory cache and the persisted copy."""
         self._cache.clear()
+        if self._store is not None:
+            self.hass.async_create_task(self._store.async_clear())